@@ -5,9 +5,15 @@ Database connection and session management
 """
 
 import os
+import time
+import threading
+from functools import wraps
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Generator
 import mysql.connector
-from mysql.connector import pooling
+from mysql.connector import pooling, HAVE_CEXT
+from mysql.connector.errors import PoolError
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -20,41 +26,203 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'lok_sabha_db'),
     'user': os.getenv('DB_USER', 'root'),
     'password': os.getenv('DB_PASSWORD', ''),
+    # Use the C extension when it is installed; falls back to pure Python
+    'use_pure': False,
 }
 
-# Create connection pool for better performance
-connection_pool = pooling.MySQLConnectionPool(
+if not HAVE_CEXT:
+    # Row decoding then runs in Python and list endpoints get noticeably slower
+    print("mysql-connector C extension not available; using the pure Python driver")
+
+# Pool tuning (mysql-connector caps pool_size at 32)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 25))
+DB_WRITE_POOL_SIZE = int(os.getenv('DB_WRITE_POOL_SIZE', 4))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+
+class LazyPool:
+    """
+    A MySQLConnectionPool that is only created, and connected, on first
+    checkout. `python main.py` imports this module in the uvicorn
+    supervisor too, which never queries and must start with MySQL down.
+    """
+    def __init__(self, **config):
+        self.config = config
+        self.reset_session = config['pool_reset_session']
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def get_connection(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = pooling.MySQLConnectionPool(**self.config)
+        return self._pool.get_connection()
+
+# Reads run in autocommit, so a SELECT never opens a transaction or leaves
+# a stale snapshot on the connection for the next request
+connection_pool = LazyPool(
     pool_name="lok_sabha_pool",
-    pool_size=10,
+    pool_size=DB_POOL_SIZE,
+    pool_reset_session=False,
+    autocommit=True,
+    **DB_CONFIG
+)
+
+# Writes commit explicitly; resetting the session on release rolls back
+# anything an endpoint left uncommitted (and the locks it held)
+write_pool = LazyPool(
+    pool_name="lok_sabha_write_pool",
+    pool_size=DB_WRITE_POOL_SIZE,
     pool_reset_session=True,
+    autocommit=False,
     **DB_CONFIG
 )
 
-def get_db() -> Generator:
+# The pools raise as soon as they are empty; these make bursts queue instead
+pool_slots = {
+    connection_pool: threading.BoundedSemaphore(DB_POOL_SIZE),
+    write_pool: threading.BoundedSemaphore(DB_WRITE_POOL_SIZE),
+}
+
+@contextmanager
+def pooled_connection(pool=connection_pool):
     """
-    Get database connection from pool
+    Check a connection out of `pool`, waiting up to DB_POOL_TIMEOUT
+    seconds for one to be free before raising PoolError
+    """
+    slots = pool_slots[pool]
+    if not slots.acquire(timeout=DB_POOL_TIMEOUT):
+        raise PoolError("Timed out waiting for a database connection")
+    connection = None
+    try:
+        connection = pool.get_connection()
+        yield connection
+    finally:
+        try:
+            if connection and pool.reset_session:
+                # COM_RESET_CONNECTION on release deallocates prepared statements
+                forget_prepared(connection)
+            if connection:
+                # Always hand it back: a dropped connection is reconnected on
+                # its next checkout, whereas skipping close() shrinks the pool.
+                # The reset on a dead socket raises, but the connector still
+                # returns the connection to the pool.
+                connection.close()
+        finally:
+            slots.release()
+
+def get_read_db() -> Generator:
+    """
+    Get an autocommit connection from the read pool
     Usage in FastAPI endpoints:
-        def endpoint(db = Depends(get_db)):
+        def endpoint(db = Depends(get_read_db)):
             cursor = db.cursor(dictionary=True)
             ...
     """
-    connection = None
-    try:
-        connection = connection_pool.get_connection()
+    with pooled_connection() as connection:
         yield connection
+
+def get_write_db() -> Generator:
+    """Get a transactional connection from the write pool; call db.commit()"""
+    with pooled_connection(write_pool) as connection:
+        yield connection
+
+# Server-side statements kept per connection; MySQL caps the total across
+# all sessions at max_prepared_stmt_count
+PREPARED_CACHE_SIZE = int(os.getenv('PREPARED_CACHE_SIZE', 64))
+
+def prepared_execute(db, sql, params, dictionary=False):
+    """
+    Run `sql` as a server-side prepared statement and return its cursor
+    Prepared cursors are kept on the underlying connection keyed by SQL text,
+    so repeat calls on the same pooled connection only bind and execute.
+    The least recently used one is closed once there are more than
+    PREPARED_CACHE_SIZE.
+    """
+    cnx = getattr(db, '_cnx', db)
+    registry = getattr(cnx, '_prepared_cursors', None)
+    if registry is None or registry[0] != cnx.connection_id:
+        # First use, or the pool reconnected and the old statements are gone
+        registry = cnx._prepared_cursors = (cnx.connection_id, OrderedDict())
+    
+    cursors = registry[1]
+    key = (sql, dictionary)
+    entry = cursors.get(key)
+    if entry is None:
+        entry = cursors[key] = (db.cursor(prepared=True, dictionary=dictionary), sql)
+        if len(cursors) > PREPARED_CACHE_SIZE:
+            # Closing the cursor deallocates its statement on the server
+            cursors.popitem(last=False)[1][0].close()
+    else:
+        cursors.move_to_end(key)
+    cursor, statement = entry
+    # Always pass the same string object so the cursor skips re-preparing
+    cursor.execute(statement, params)
+    return cursor
+
+def prepared_fetch(db, sql, params):
+    """Like prepared_execute, but return all rows as dicts"""
+    return prepared_execute(db, sql, params, dictionary=True).fetchall()
+
+def prepared_fetch_one(db, sql, params):
+    """Like prepared_fetch, but return only the first row or None"""
+    rows = prepared_fetch(db, sql, params)
+    return rows[0] if rows else None
+
+def fetch_all(db, sql, params=(), dictionary=False):
+    """
+    Run a small one-off query on a buffered cursor and return every row
+    The whole result is read on execute, so the server-side result is
+    released at once.
+    """
+    cursor = db.cursor(buffered=True, dictionary=dictionary)
+    try:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
     finally:
-        if connection and connection.is_connected():
-            connection.close()
+        cursor.close()
+
+def forget_prepared(db):
+    """Drop the prepared cursors cached on a connection"""
+    cnx = getattr(db, '_cnx', db)
+    if cnx is not None:
+        cnx._prepared_cursors = None
+
+def ttl_cache(seconds):
+    """
+    Cache a no-argument function's result for `seconds`
+    The first call after expiry, or after cache_clear(), runs the function
+    again; concurrent callers wait for it rather than all running it.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        state = {'expiry': 0.0, 'value': None}
+
+        @wraps(func)
+        def wrapper():
+            with lock:
+                if time.monotonic() >= state['expiry']:
+                    state['value'] = func()
+                    state['expiry'] = time.monotonic() + seconds
+                return state['value']
+
+        def cache_clear():
+            with lock:
+                state['expiry'] = 0.0
 
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+@ttl_cache(seconds=int(os.getenv('HEALTH_CACHE_SECONDS', 3)))
 def test_connection():
     """Test database connection"""
     try:
-        conn = connection_pool.get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with pooled_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
         return True
     except Exception as e:
         print(f"Database connection failed: {e}")
@@ -4,26 +4,99 @@ main.py
 FastAPI application for Lok Sabha Database
 """
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, Request, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse, Response
-from typing import Optional
+from fastapi.responses import Response, JSONResponse, ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+from typing import NamedTuple, Optional
 import os
+import re
+import math
+from inspect import Parameter, Signature
+import json
+import base64
+import time
+import asyncio
+import hashlib
+import threading
+import uuid
+from functools import lru_cache, partial
+from decimal import Decimal
+from datetime import timedelta
 from dotenv import load_dotenv
-import requests as req
-from io import BytesIO
+from anyio import to_thread
+from cachetools import LRUCache, TTLCache, cached
+from cachetools.keys import hashkey
+import httpx
+import orjson
 
-from database import get_db, test_connection
+from database import (
+    get_read_db, get_write_db, pooled_connection, write_pool, test_connection,
+    prepared_execute, prepared_fetch_one, fetch_all, ttl_cache, PoolError
+)
 from models import *
 
 load_dotenv()
 
+THREADPOOL_SIZE = int(os.getenv('THREADPOOL_SIZE', 100))
+
+
+def json_default(value):
+    """Serialize the MySQL column types orjson doesn't handle natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode(errors='replace')
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError
+
+
+class RowJSONResponse(ORJSONResponse):
+    """
+    orjson response that can take raw database rows
+    Returning one directly from an endpoint skips response_model validation
+    and jsonable_encoder, which otherwise walk every row of every page.
+    """
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, default=json_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients on startup and close them on shutdown"""
+    # Sync endpoints run on AnyIO's worker threads (40 by default). Threads
+    # mostly sit waiting on MySQL, so size the pool for in-flight queries
+    # rather than CPU cores.
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+    # One keep-alive pool for all outbound image fetches, so TCP/TLS
+    # handshakes are reused across requests instead of paid per image
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=50)
+    )
+
+    # Models are defer_build, so the first /docs or /openapi.json request
+    # would otherwise build every response schema; do it off the event loop
+    threading.Thread(target=app.openapi, name="openapi-warmup", daemon=True).start()
+    yield
+    await app.state.http.aclose()
+
+
 app = FastAPI(
     title=os.getenv('API_TITLE', 'Lok Sabha Database API'),
     description=os.getenv('API_DESCRIPTION', 'REST API for Lok Sabha member data'),
     version=os.getenv('API_VERSION', '1.0.0'),
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=RowJSONResponse,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -35,6 +108,237 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(PoolError)
+def pool_exhausted(request, exc):
+    """Every pooled connection stayed busy for DB_POOL_TIMEOUT seconds"""
+    return JSONResponse(status_code=503, content={"detail": "Database busy, please retry"})
+
+
+def encode_cursor(values):
+    """Pack the sort-key values of a row into an opaque, URL-safe page cursor"""
+    raw = json.dumps(list(values), default=str, separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(token, width):
+    """Unpack a page cursor made by encode_cursor, or raise 400 if it is malformed"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except ValueError:
+        values = None
+    if not isinstance(values, list) or len(values) != width or not all(map(cursor_value_ok, values)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def cursor_value_ok(value):
+    """Whether a decoded cursor value can be bound as a MySQL parameter"""
+    if type(value) is int:
+        return -2**63 <= value < 2**63
+    if type(value) is float:
+        return math.isfinite(value)
+    return value is None or type(value) is str
+
+
+# Paginated rows come straight from MySQL, so list routes return a
+# RowJSONResponse and only borrow PaginatedResponse for the OpenAPI schema
+PAGINATED_RESPONSES = {200: {"model": PaginatedResponse}}
+
+def order_clause(order_by, keyset):
+    """ORDER BY for a list: the keyset columns descending, else `order_by`"""
+    if keyset:
+        order_by = ", ".join(f"{column} DESC" for column in keyset)
+    return f" ORDER BY {order_by}" if order_by else ""
+
+@lru_cache(maxsize=256)
+def page_statements(table, where_clauses, order_by, keyset, columns):
+    """
+    Build paginate()'s SQL for one table and filter combination
+    Memoized (for the 256 most recent combinations), so each combination's
+    strings are built once and the prepared-statement registry is handed
+    the same objects every time.
+    Returns (page_sql, count_sql).
+    """
+    where_sql = f" WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    order_sql = order_clause(order_by, keyset)
+
+    page_sql = f"SELECT {columns}, COUNT(*) OVER() AS _total FROM {table}{where_sql}{order_sql} LIMIT %s OFFSET %s"
+    count_sql = f"SELECT COUNT(*) FROM {table}{where_sql}"
+    return page_sql, count_sql
+
+@lru_cache(maxsize=256)
+def seek_statement(table, where_clauses, keyset, columns, nulls):
+    """
+    Build the SQL for the page after a cursor, memoized like page_statements
+
+    In DESC order MySQL sorts NULL last, and a row comparison such as
+    (a, id) < (x, y) is never true when either side holds a NULL, so the
+    seek is spelled out column by column. `nulls` flags which cursor values
+    are NULL; seek_params() gives the matching parameters.
+    """
+    branches = []
+    for i, column in enumerate(keyset):
+        if nulls[i]:
+            continue  # nothing sorts after NULL in this position
+        equal = [f"{key} IS NULL" if null else f"{key} = %s" for key, null in zip(keyset[:i], nulls[:i])]
+        branches.append(" AND ".join(equal + [f"({column} < %s OR {column} IS NULL)"]))
+    seek = f"({' OR '.join(f'({branch})' for branch in branches) or 'FALSE'})"
+    return f"SELECT {columns} FROM {table} WHERE {' AND '.join(where_clauses + (seek,))}{order_clause(None, keyset)} LIMIT %s"
+
+def seek_params(values):
+    """Parameters for seek_statement(), in the order its placeholders appear"""
+    params = []
+    for i, value in enumerate(values):
+        if value is not None:
+            params += [earlier for earlier in values[:i] if earlier is not None]
+            params.append(value)
+    return params
+
+def page_params(
+    page: int = Query(1, ge=1, description="Page number"),
+    size: int = Query(50, ge=1, le=100, description="Items per page"),
+):
+    """Page/size query parameters"""
+    return page, size
+
+# Deeper OFFSET pages make MySQL read and discard every earlier row;
+# past this point callers must follow next_cursor instead
+MAX_OFFSET_ROWS = int(os.getenv('MAX_OFFSET_ROWS', 10000))
+
+def safe_page(pagination: tuple = Depends(page_params)):
+    """
+    page_params for routes that take ?after=, refusing pages that reach
+    past MAX_OFFSET_ROWS
+    """
+    page, size = pagination
+    if page * size > MAX_OFFSET_ROWS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Page too deep; use cursor pagination (after=next_cursor) beyond {MAX_OFFSET_ROWS} rows"
+        )
+    return pagination
+
+def paginate(db, table, where_clauses, params, order_by, page, size, keyset=None, after=None, columns="*",
+             columnar=False):
+    """
+    Fetch one page of `table` and build the standard paginated response
+
+    The total row count rides along with the page via COUNT(*) OVER(),
+    so a page costs one round trip instead of a COUNT(*) plus a SELECT.
+
+    `keyset` names the columns (unique last, all descending) that order the
+    table. Pages then carry a `next_cursor`, and passing it back as `after`
+    seeks straight past the previous page instead of scanning OFFSET rows.
+    Seek pages skip the total count. Rows whose sort key is NULL sort last
+    and are reached by the cursor walk like any other.
+
+    `columns` must include every keyset column. With no `where_clauses`
+    the statements carry no WHERE at all. Statements run prepared, so each
+    filter combination is parsed once per connection; rows come back as
+    tuples and are zipped into dicts against cursor.description.
+
+    With `columnar`, `data` is {"columns": [...], "rows": [[...], ...]}
+    instead, so the column names are sent once per page, not once per row.
+    """
+    page_sql, count_sql = page_statements(table, tuple(where_clauses), order_by, keyset, columns)
+
+    if after is not None:
+        values = decode_cursor(after, len(keyset))
+        seek_sql = seek_statement(table, tuple(where_clauses), keyset, columns,
+                                  tuple(value is None for value in values))
+        cursor = prepared_execute(db, seek_sql, params + seek_params(values) + [size])
+        rows = cursor.fetchall()
+        names = [d[0] for d in cursor.description]
+        total = page = pages = None
+    else:
+        offset = (page - 1) * size
+        cursor = prepared_execute(db, page_sql, params + [size, offset])
+        rows = cursor.fetchall()
+        # _total is the last column; dropping its name makes zip stop before it
+        names = [d[0] for d in cursor.description][:-1]
+
+        if rows:
+            total = rows[0][-1]
+        elif page > 1:
+            # Past the last page no row carries the window count, so ask for it
+            total = prepared_execute(db, count_sql, params).fetchall()[0][0]
+        else:
+            total = 0
+        pages = (total + size - 1) // size
+
+    if columnar:
+        data = {"columns": names, "rows": [row[:len(names)] for row in rows]}
+    else:
+        data = [dict(zip(names, row)) for row in rows]
+
+    next_cursor = None
+    if keyset and len(rows) == size:
+        last = dict(zip(names, rows[-1]))
+        next_cursor = encode_cursor(last[column] for column in keyset)
+
+    return {"total": total, "page": page, "size": size, "pages": pages, "data": data, "next_cursor": next_cursor}
+
+
+# Columns served by the list endpoints: the fields of the matching models,
+# so wide columns the list views never show stay in MySQL
+MEMBER_LIST_COLUMNS = "mp_code, name, party, state, constituency, terms, status, profile_link, image_url"
+ASSURANCE_COLUMNS = "id, mp_code, member, assu_no, loksabha, session, ministry, status"
+GALLERY_COLUMNS = "id, mp_code, mp_name, loksabha, session, subject_title, videoUrl, eventDate"
+COMMITTEE_COLUMNS = "id, mp_code, loksabha, committeeName, status, date_from, date_to"
+PRIVATE_BILL_COLUMNS = "id, mp_code, loksabha, session, billName, debate_date"
+GOVERNMENT_BILL_COLUMNS = "id, srno, loksabha, session, bill_title, debate_date"
+QUESTION_COLUMNS = "questionId, srno, questionNo, questionType, questionDate, ministry, subject"
+DEBATE_COLUMNS = "debateId, srno, loksabha, session, title, debateDate"
+SPECIAL_MENTION_COLUMNS = "id, srno, mentionNo, madeDate, subject"
+TOUR_COLUMNS = "id, srno, purpose, tour_place, tour_date"
+
+# Lists return the columns above; ?full=true returns whole rows instead
+FULL_ROWS = Query(False, description="Return every column, including long text fields")
+
+
+# InnoDB splits FULLTEXT tokens on anything that isn't a word character,
+# which also drops the BOOLEAN MODE operators
+FULLTEXT_WORD = re.compile(r'\w+')
+
+# InnoDB never indexes words shorter than innodb_ft_min_token_size or on its
+# default stopword list, and a required +word* term for one matches nothing
+FULLTEXT_MIN_TOKEN_SIZE = int(os.getenv('FULLTEXT_MIN_TOKEN_SIZE', 3))
+FULLTEXT_STOPWORDS = frozenset(
+    "a about an are as at be by com de en for from how i in is it la of on or "
+    "that the this to was what when where who will with und www".split()
+)
+
+# Longest free-text filter accepted, in distinct words
+MAX_FILTER_WORDS = int(os.getenv('MAX_FILTER_WORDS', 10))
+
+def text_filter(columns, text):
+    """
+    Build WHERE clauses and params requiring every word of `text` as a prefix
+    e.g. "uttar prad" -> MATCH(...) AGAINST ('+uttar* +prad*' IN BOOLEAN MODE)
+
+    Words FULLTEXT can't see are matched at a word boundary by one REGEXP
+    instead, which only has to check the rows MATCH already narrowed to.
+    So there are at most two clauses and the statement shape doesn't
+    depend on the input. Raises 400 when `text` has no words or too many.
+    """
+    words = list(dict.fromkeys(word.lower() for word in FULLTEXT_WORD.findall(text)))
+    if not words:
+        raise HTTPException(status_code=400, detail=f"No searchable words in {text!r}")
+    if len(words) > MAX_FILTER_WORDS:
+        raise HTTPException(status_code=400, detail=f"Filters are limited to {MAX_FILTER_WORDS} words")
+
+    clauses = []
+    params = []
+    indexed = [word for word in words if len(word) >= FULLTEXT_MIN_TOKEN_SIZE and word not in FULLTEXT_STOPWORDS]
+    if indexed:
+        clauses.append(f"MATCH({columns}) AGAINST (%s IN BOOLEAN MODE)")
+        params.append(" ".join(f"+{word}*" for word in indexed))
+    unindexed = [word for word in words if word not in indexed]
+    if unindexed:
+        # One lookahead per word, so every word must appear somewhere
+        clauses.append(f"CONCAT_WS(' ', {columns}) REGEXP %s")
+        params.append("^" + "".join(rf"(?=.*\b{word})" for word in unindexed))
+    return clauses, params
+
+
 @app.get("/", tags=["Root"])
 def root():
     """API root endpoint"""
@@ -58,557 +362,386 @@ def health_check():
     }
 
 
-@app.get("/api/members", response_model=PaginatedResponse, tags=["Members"])
-# def get_members(
-#     page: int = Query(1, ge=1, description="Page number"),
-#     size: int = Query(50, ge=1, le=100, description="Items per page"),
-#     party: Optional[str] = Query(None, description="Filter by party name"),
-#     state: Optional[str] = Query(None, description="Filter by state"),
-#     loksabha: Optional[int] = Query(None, description="Filter by Lok Sabha term"),
-#     db = Depends(get_db)
-# ):
-#     """Get all members with pagination and filters"""
-#     cursor = db.cursor(dictionary=True)
-    
-#     where_clauses = []
-#     params = []
-    
-#     if party:
-#         where_clauses.append("party LIKE %s")
-#         params.append(f"%{party}%")
-#     if state:
-#         where_clauses.append("state LIKE %s")
-#         params.append(f"%{state}%")
-#     if loksabha:
-#         where_clauses.append("terms LIKE %s")
-#         params.append(f"%{loksabha}%")
-    
-#     where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-#     offset = (page - 1) * size
-    
-#     cursor.execute(f"SELECT COUNT(*) as total FROM lok_sabha_members WHERE {where_sql}", params)
-#     total = cursor.fetchone()['total']
-    
-#     cursor.execute(
-#         f"SELECT * FROM lok_sabha_members WHERE {where_sql} ORDER BY name LIMIT %s OFFSET %s",
-#         params + [size, offset]
-#     )
-#     data = cursor.fetchall()
-#     cursor.close()
-    
-#     return {
-#         "total": total,
-#         "page": page,
-#         "size": size,
-#         "pages": (total + size - 1) // size,
-#         "data": data
-#     }
-
-@app.get("/api/members", response_model=PaginatedResponse, tags=["Members"])
+# Member data changes rarely and the filter/page permutations the UI asks
+# for repeat heavily, so the read-only member routes are served from here.
+# Clear it from any endpoint that writes member tables.
+MEMBER_CACHE_TTL = int(os.getenv('MEMBER_CACHE_TTL', 120))
+member_cache = TTLCache(maxsize=int(os.getenv('MEMBER_CACHE_SIZE', 4096)), ttl=MEMBER_CACHE_TTL)
+member_cache_lock = threading.Lock()
+
+def member_cached(namespace):
+    """
+    Cache a function's result in member_cache, keyed by `namespace` and its
+    arguments. The function must open its own connection so hits skip the pool.
+    """
+    return cached(member_cache, key=partial(hashkey, namespace), lock=member_cache_lock)
+
+# lok_sabha_members holds a few thousand rows, so any OFFSET stays cheap
+# and the route keeps its name order instead of taking a cursor
+@app.get("/api/members", responses=PAGINATED_RESPONSES, tags=["Members"])
 def get_members(
-    page: int = Query(1, ge=1, description="Page number"),
-    size: int = Query(50, ge=1, le=100, description="Items per page"),
+    pagination: tuple = Depends(page_params),
     party: Optional[str] = Query(None, description="Filter by party name"),
     state: Optional[str] = Query(None, description="Filter by state"),
     status: Optional[str] = Query(None, description="Filter by status: Sitting or Former"),
     search: Optional[str] = Query(None, description="Search by name, constituency, party"),
     loksabha: Optional[int] = Query(None, description="Filter by Lok Sabha term"),
-    db = Depends(get_db)
+    full: bool = FULL_ROWS
 ):
     """Get all members with pagination and filters"""
-    cursor = db.cursor(dictionary=True)
-    
+    page, size = pagination
+    return RowJSONResponse(list_members(page, size, party, state, status, search, loksabha, full))
+
+# Counter columns on lok_sabha_members (migrations/004) -> statistics keys
+PROFILE_COUNTERS = {
+    "cnt_assurances": "assurances",
+    "cnt_gallery": "gallery_videos",
+    "cnt_bills": "private_bills",
+    "cnt_committees": "committees",
+    "cnt_questions": "questions",
+    "cnt_debates": "debates",
+}
+
+def public_member(row):
+    """A copy of a lok_sabha_members row without the internal counter columns"""
+    return {column: value for column, value in row.items() if column not in PROFILE_COUNTERS}
+
+@member_cached("members")
+def list_members(page, size, party, state, status, search, loksabha, full):
+    """Load one page of members for get_members"""
     where_clauses = []
     params = []
     
-    if search:
-        where_clauses.append("(name LIKE %s OR constituency LIKE %s OR party LIKE %s OR state LIKE %s)")
-        params.extend([f"%{search}%", f"%{search}%", f"%{search}%", f"%{search}%"])
-    if party:
-        where_clauses.append("party LIKE %s")
-        params.append(f"%{party}%")
-    if state:
-        where_clauses.append("state LIKE %s")
-        params.append(f"%{state}%")
+    # Text filters go through the FULLTEXT indexes from migrations/001
+    for columns, text in (("name, constituency, party, state", search), ("party", party), ("state", state)):
+        if text:
+            clauses, text_params = text_filter(columns, text)
+            where_clauses += clauses
+            params += text_params
     if status:
         where_clauses.append("status = %s")
         params.append(status)
     if loksabha:
-        where_clauses.append("terms LIKE %s")
-        params.append(f"%{loksabha}%")
-    
-    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM lok_sabha_members WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
+        where_clauses.append(
+            "EXISTS (SELECT 1 FROM mp_terms t WHERE t.mp_code = lok_sabha_members.mp_code AND t.term = %s)"
+        )
+        params.append(loksabha)
     
-    cursor.execute(
-        f"SELECT * FROM lok_sabha_members WHERE {where_sql} ORDER BY name LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
+    with pooled_connection() as db:
+        result = paginate(db, "lok_sabha_members", where_clauses, params, "name", page, size,
+                          columns="*" if full else MEMBER_LIST_COLUMNS)
     
-    return {
-        "total": total,
-        "page": page,
-        "size": size,
-        "pages": (total + size - 1) // size,
-        "data": data
-    }
+    if full:
+        result["data"] = [public_member(row) for row in result["data"]]
+    return result
+
+@member_cached("row")
+def fetch_member_row(sql, mp_code):
+    """Run a single-row lookup by mp_code (a miss caches None too)"""
+    with pooled_connection() as db:
+        return prepared_fetch_one(db, sql, (mp_code,))
+
+MEMBER_SQL = "SELECT * FROM lok_sabha_members WHERE mp_code = %s"
 
 @app.get("/api/members/{mp_code}", tags=["Members"])
-def get_member(mp_code: int, db = Depends(get_db)):
+def get_member(mp_code: int):
     """Get specific member by mp_code"""
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM lok_sabha_members WHERE mp_code = %s", (mp_code,))
-    member = cursor.fetchone()
-    cursor.close()
+    member = fetch_member_row(MEMBER_SQL, mp_code)
     
     if not member:
         raise HTTPException(status_code=404, detail="Member not found")
-    return member
+    return RowJSONResponse(public_member(member))
 
-@app.get("/api/member-profile/{mp_code}", response_model=MemberProfile, tags=["Members"])
-def get_complete_profile(mp_code: int, db = Depends(get_db)):
+@app.get("/api/member-profile/{mp_code}", responses={200: {"model": MemberProfile}}, tags=["Members"])
+def get_complete_profile(mp_code: int):
     """Get complete member profile with all statistics"""
-    cursor = db.cursor(dictionary=True)
-    
-    cursor.execute("SELECT * FROM lok_sabha_members WHERE mp_code = %s", (mp_code,))
-    member = cursor.fetchone()
+    row = fetch_member_row(MEMBER_SQL, mp_code)
     
-    if not member:
+    if not row:
         raise HTTPException(status_code=404, detail="Member not found")
     
-    cursor.execute("SELECT COUNT(*) as count FROM assurance WHERE mp_code = %s", (mp_code,))
-    assurances = cursor.fetchone()['count']
-    
-    cursor.execute("SELECT COUNT(*) as count FROM gallery WHERE mp_code = %s", (mp_code,))
-    gallery = cursor.fetchone()['count']
-    
-    cursor.execute("SELECT COUNT(*) as count FROM member_bills WHERE mp_code = %s", (mp_code,))
-    bills = cursor.fetchone()['count']
-    
-    cursor.execute("SELECT COUNT(*) as count FROM member_committees WHERE mp_code = %s", (mp_code,))
-    committees = cursor.fetchone()['count']
-    
-    cursor.execute("SELECT COUNT(*) as count FROM member_questions WHERE srno = %s", (mp_code,))
-    questions = cursor.fetchone()['count']
-    
-    cursor.execute("SELECT COUNT(*) as count FROM member_debates WHERE srno = %s", (mp_code,))
-    debates = cursor.fetchone()['count']
-    
-    cursor.close()
-    
-    return {
-        "member": member,
-        "statistics": {
-            "assurances": assurances,
-            "gallery_videos": gallery,
-            "private_bills": bills,
-            "committees": committees,
-            "questions": questions,
-            "debates": debates
-        }
-    }
+    # The counts are trigger-maintained columns of the member row itself.
+    # The row is shared through member_cache, so copy rather than pop.
+    return RowJSONResponse({
+        "member": public_member(row),
+        "statistics": {key: row[column] for column, key in PROFILE_COUNTERS.items()}
+    })
 
 
-@app.get("/api/assurances", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_assurances(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get government assurances"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = []
-    params = []
-    
-    if mp_code:
-        where_clauses.append("mp_code = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM assurance WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM assurance WHERE {where_sql} ORDER BY loksabha DESC, session DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+class ListEndpoint(NamedTuple):
+    """A paginated, mp_code/loksabha-filterable list route over one table"""
+    path: str
+    name: str
+    doc: str
+    tag: str
+    table: str
+    member_column: str              # column the mp_code filter applies to
+    columns: str = "*"
+    filter_loksabha: bool = True
+    order_by: Optional[str] = None
+    keyset: Optional[tuple] = None  # enables ?after= seek pagination
+    cache_pages: bool = False       # keep serialized pages in list_page_cache
 
 
-@app.get("/api/gallery", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_gallery(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get gallery videos"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = []
-    params = []
-    
-    if mp_code:
-        where_clauses.append("mp_code = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM gallery WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM gallery WHERE {where_sql} ORDER BY eventDate DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+# Serialized pages of the busiest lists, keyed by route and query
+# parameters and bounded by total bytes. Hits skip the database and orjson.
+LIST_CACHE_TTL = int(os.getenv('LIST_CACHE_TTL', 60))
+LIST_CACHE_BYTES = int(os.getenv('LIST_CACHE_BYTES', 32 * 1024 * 1024))
+list_page_cache = TTLCache(maxsize=LIST_CACHE_BYTES, ttl=LIST_CACHE_TTL, getsizeof=len)
+list_page_cache_lock = threading.Lock()
 
 
-@app.get("/api/committees", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_committees(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get committee memberships"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["mp_code IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("mp_code = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_committees WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_committees WHERE {where_sql} ORDER BY loksabha DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+LIST_ENDPOINTS = [
+    ListEndpoint("/api/assurances", "get_assurances", "Get government assurances", "Parliamentary Activities",
+                 "assurance", "mp_code", ASSURANCE_COLUMNS,
+                 keyset=("loksabha", "session", "id")),
+    ListEndpoint("/api/gallery", "get_gallery", "Get gallery videos", "Parliamentary Activities",
+                 "gallery", "mp_code", GALLERY_COLUMNS,
+                 keyset=("eventDate", "id")),
+    ListEndpoint("/api/committees", "get_committees", "Get committee memberships", "Parliamentary Activities",
+                 "member_committees", "mp_code", COMMITTEE_COLUMNS,
+                 keyset=("loksabha", "id")),
+    ListEndpoint("/api/bills/private", "get_private_bills", "Get private member bills", "Bills",
+                 "member_bills", "mp_code", PRIVATE_BILL_COLUMNS,
+                 keyset=("loksabha", "id")),
+    ListEndpoint("/api/bills/government", "get_government_bills", "Get government bills", "Bills",
+                 "government_bills", "srno", GOVERNMENT_BILL_COLUMNS,
+                 keyset=("loksabha", "id")),
+    ListEndpoint("/api/questions", "get_questions", "Get parliamentary questions", "Parliamentary Activities",
+                 "member_questions", "srno", QUESTION_COLUMNS, filter_loksabha=False,
+                 keyset=("questionDate", "questionId"), cache_pages=True),
+    ListEndpoint("/api/debates", "get_debates", "Get parliamentary debates", "Parliamentary Activities",
+                 "member_debates", "srno", DEBATE_COLUMNS,
+                 keyset=("loksabha", "debateId"), cache_pages=True),
+    ListEndpoint("/api/special-mentions", "get_special_mentions", "Get special mentions (Zero hour)", "Parliamentary Activities",
+                 "member_special_mentions", "srno", SPECIAL_MENTION_COLUMNS, filter_loksabha=False,
+                 keyset=("madeDate", "id")),
+    ListEndpoint("/api/tours", "get_tours", "Get MP tours", "Parliamentary Activities",
+                 "mp_tour", "srno", TOUR_COLUMNS, filter_loksabha=False,
+                 keyset=("tour_date", "id")),
+    ListEndpoint("/api/attendance", "get_attendance", "Get attendance records", "Parliamentary Activities",
+                 "member_attendance", "mp_code",
+                 keyset=("loksabha", "id")),
+]
 
 
-@app.get("/api/bills/private", response_model=PaginatedResponse, tags=["Bills"])
-def get_private_bills(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get private member bills"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["mp_code IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("mp_code = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_bills WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_bills WHERE {where_sql} ORDER BY loksabha DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+def add_list_endpoint(spec: ListEndpoint):
+    """Register the GET route described by `spec`"""
+    member_clause = f"{spec.member_column} = %s"
 
-@app.get("/api/bills/government", response_model=PaginatedResponse, tags=["Bills"])
-def get_government_bills(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get government bills"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["srno IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("srno = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM government_bills WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM government_bills WHERE {where_sql} ORDER BY loksabha DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+    def handler(mp_code=None, loksabha=None, pagination=(1, 50), full=False, columnar=False, after=None):
+        page, size = pagination
+        cache_key = (spec.name, mp_code, loksabha, page, size, full, columnar, after)
+        if spec.cache_pages:
+            with list_page_cache_lock:
+                body = list_page_cache.get(cache_key)
+            if body is not None:
+                return Response(content=body, media_type="application/json")
 
+        where_clauses = []
+        params = []
+        
+        if mp_code:
+            where_clauses.append(member_clause)
+            params.append(mp_code)
+        if loksabha:
+            where_clauses.append("loksabha = %s")
+            params.append(loksabha)
+        
+        with pooled_connection() as db:
+            result = paginate(db, spec.table, where_clauses, params, spec.order_by, page, size,
+                              keyset=spec.keyset, after=after, columns="*" if full else spec.columns,
+                              columnar=columnar)
+        
+        response = RowJSONResponse(result)
+        if spec.cache_pages:
+            with list_page_cache_lock:
+                try:
+                    list_page_cache[cache_key] = response.body
+                except ValueError:
+                    pass  # larger than the whole cache
+        return response
 
-@app.get("/api/questions", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_questions(
-    mp_code: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get parliamentary questions"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["srno IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("srno = %s")
-        params.append(mp_code)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_questions WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_questions WHERE {where_sql} ORDER BY questionDate DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
-
-
-@app.get("/api/debates", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_debates(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get parliamentary debates"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["srno IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("srno = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_debates WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_debates WHERE {where_sql} ORDER BY loksabha DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
-
+    # FastAPI reads query parameters off the signature, so expose only the
+    # filters this table supports
+    parameters = [Parameter("mp_code", Parameter.KEYWORD_ONLY, default=None, annotation=Optional[int])]
+    if spec.filter_loksabha:
+        parameters.append(Parameter("loksabha", Parameter.KEYWORD_ONLY, default=None, annotation=Optional[int]))
+    parameters += [
+        Parameter("pagination", Parameter.KEYWORD_ONLY, annotation=tuple,
+                  default=Depends(safe_page if spec.keyset else page_params)),
+        Parameter("full", Parameter.KEYWORD_ONLY, default=FULL_ROWS, annotation=bool),
+        Parameter("columnar", Parameter.KEYWORD_ONLY, annotation=bool,
+                  default=Query(False, description="Return data as {columns, rows} instead of one object per row")),
+    ]
+    if spec.keyset:
+        parameters.append(Parameter("after", Parameter.KEYWORD_ONLY, annotation=Optional[str],
+                                    default=Query(None, description="next_cursor from the previous page")))
 
-@app.get("/api/special-mentions", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_special_mentions(
-    mp_code: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get special mentions (Zero hour)"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["srno IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("srno = %s")
-        params.append(mp_code)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_special_mentions WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_special_mentions WHERE {where_sql} ORDER BY madeDate DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+    handler.__signature__ = Signature(parameters)
+    handler.__name__ = spec.name
+    handler.__doc__ = spec.doc
+    app.get(spec.path, responses=PAGINATED_RESPONSES, tags=[spec.tag], name=spec.name)(handler)
 
 
-@app.get("/api/tours", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_tours(
-    mp_code: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get MP tours"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["srno IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("srno = %s")
-        params.append(mp_code)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM mp_tour WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM mp_tour WHERE {where_sql} ORDER BY tour_date DESC LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+for spec in LIST_ENDPOINTS:
+    add_list_endpoint(spec)
 
+PERSONAL_DETAILS_SQL = "SELECT * FROM member_personal_details WHERE srno = %s"
+OTHER_DETAILS_SQL = "SELECT * FROM member_other_details WHERE srno = %s"
+DASHBOARD_SQL = "SELECT * FROM member_dashboard WHERE srno = %s"
 
 @app.get("/api/personal-details/{mp_code}", tags=["Member Details"])
-def get_personal_details(mp_code: int, db = Depends(get_db)):
+def get_personal_details(mp_code: int):
     """Get member personal details"""
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM member_personal_details WHERE srno = %s", (mp_code,))
-    data = cursor.fetchone()
-    cursor.close()
+    data = fetch_member_row(PERSONAL_DETAILS_SQL, mp_code)
     
     if not data:
         raise HTTPException(status_code=404, detail="Personal details not found")
-    return data
+    return RowJSONResponse(data)
 
 @app.get("/api/other-details/{mp_code}", tags=["Member Details"])
-def get_other_details(mp_code: int, db = Depends(get_db)):
+def get_other_details(mp_code: int):
     """Get member other details"""
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM member_other_details WHERE srno = %s", (mp_code,))
-    data = cursor.fetchone()
-    cursor.close()
+    data = fetch_member_row(OTHER_DETAILS_SQL, mp_code)
     
     if not data:
         raise HTTPException(status_code=404, detail="Other details not found")
-    return data
+    return RowJSONResponse(data)
 
 @app.get("/api/dashboard/{mp_code}", tags=["Member Details"])
-def get_dashboard(mp_code: int, db = Depends(get_db)):
+def get_dashboard(mp_code: int):
     """Get member dashboard statistics"""
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("SELECT * FROM member_dashboard WHERE srno = %s", (mp_code,))
-    data = cursor.fetchone()
-    cursor.close()
+    data = fetch_member_row(DASHBOARD_SQL, mp_code)
     
     if not data:
         raise HTTPException(status_code=404, detail="Dashboard not found")
-    return data
-
-@app.get("/api/attendance", response_model=PaginatedResponse, tags=["Parliamentary Activities"])
-def get_attendance(
-    mp_code: Optional[int] = None,
-    loksabha: Optional[int] = None,
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
-):
-    """Get attendance records"""
-    cursor = db.cursor(dictionary=True)
-    
-    where_clauses = ["mp_code IS NOT NULL"]
-    params = []
-    
-    if mp_code:
-        where_clauses.append("mp_code = %s")
-        params.append(mp_code)
-    if loksabha:
-        where_clauses.append("loksabha = %s")
-        params.append(loksabha)
-    
-    where_sql = " AND ".join(where_clauses)
-    offset = (page - 1) * size
-    
-    cursor.execute(f"SELECT COUNT(*) as total FROM member_attendance WHERE {where_sql}", params)
-    total = cursor.fetchone()['total']
-    
-    cursor.execute(
-        f"SELECT * FROM member_attendance WHERE {where_sql} LIMIT %s OFFSET %s",
-        params + [size, offset]
-    )
-    data = cursor.fetchall()
-    cursor.close()
+    return RowJSONResponse(data)
+
+# The three detail tables are keyed by srno and usually wanted together.
+# Driving from the member row keeps a missing detail row as NULLs.
+MEMBER_DETAILS_SQL = """
+    SELECT m.mp_code AS srno,
+           p.fatherName, p.motherName, p.dateBirth, p.spouseName, p.qualification,
+           o.freedomFighter, o.countriesVisited, o.booksPublished, o.sportsInterests,
+           d.questionsCount, d.billsCount, d.committeeCount, d.debatesCount
+    FROM lok_sabha_members m
+    LEFT JOIN member_personal_details p ON p.srno = m.mp_code
+    LEFT JOIN member_other_details o ON o.srno = m.mp_code
+    LEFT JOIN member_dashboard d ON d.srno = m.mp_code
+    WHERE m.mp_code = %s
+    LIMIT 1
+"""
+
+@app.get("/api/members/{mp_code}/details", responses={200: {"model": MPProfile}}, tags=["Member Details"])
+def get_member_details(mp_code: int):
+    """Get personal details, other details and dashboard in one call"""
+    data = fetch_member_row(MEMBER_DETAILS_SQL, mp_code)
     
-    return {"total": total, "page": page, "size": size, "pages": (total + size - 1) // size, "data": data}
+    if not data:
+        raise HTTPException(status_code=404, detail="Member not found")
+    return RowJSONResponse(data)
+
+class CachedImage(NamedTuple):
+    """An upstream image plus the validators needed to revalidate it"""
+    expires: float
+    etag: str
+    last_modified: Optional[str]
+    content_type: str
+    content: bytes
+
+
+# Upstream images keyed by URL, bounded by total bytes. Entries outlive
+# IMAGE_CACHE_TTL so a stale copy can be revalidated with a conditional GET
+# instead of downloaded again.
+IMAGE_CACHE_BYTES = int(os.getenv('IMAGE_CACHE_BYTES', 64 * 1024 * 1024))
+IMAGE_CACHE_MAX_ITEM = int(os.getenv('IMAGE_CACHE_MAX_ITEM', 4 * 1024 * 1024))
+IMAGE_CACHE_TTL = 86400
+image_cache = LRUCache(maxsize=IMAGE_CACHE_BYTES, getsizeof=lambda entry: len(entry.content))
+image_fetches = {}
+
+
+async def download_image(url: str, stale: Optional[CachedImage]):
+    """Fetch (or revalidate) an image upstream and remember it in image_cache"""
+    headers = {}
+    if stale:
+        headers["If-None-Match"] = stale.etag
+        if stale.last_modified:
+            headers["If-Modified-Since"] = stale.last_modified
+
+    response = await app.state.http.get(url, headers=headers)
+    expires = time.monotonic() + IMAGE_CACHE_TTL
+
+    if stale and response.status_code == 304:
+        entry = stale._replace(expires=expires)
+    else:
+        response.raise_for_status()
+        content = response.content
+        entry = CachedImage(
+            expires=expires,
+            # Upstreams without an ETag still get one, so clients can revalidate
+            etag=response.headers.get('etag') or f'"{hashlib.sha1(content).hexdigest()}"',
+            last_modified=response.headers.get('last-modified'),
+            content_type=response.headers.get('content-type', 'image/jpeg'),
+            content=content
+        )
+
+    if len(entry.content) <= IMAGE_CACHE_MAX_ITEM:
+        image_cache[url] = entry
+    return entry
+
+
+async def fetch_image(url: str) -> CachedImage:
+    """
+    Return an image from cache when fresh, revalidating or downloading otherwise
+    Concurrent misses for the same URL share a single upstream request.
+    """
+    entry = image_cache.get(url)
+    if entry is not None and entry.expires > time.monotonic():
+        return entry
+
+    task = image_fetches.get(url)
+    if task is None:
+        task = asyncio.ensure_future(download_image(url, entry))
+        image_fetches[url] = task
+        task.add_done_callback(lambda _: image_fetches.pop(url, None))
+    # Shielded so one client disconnecting doesn't cancel the others' download
+    return await asyncio.shield(task)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    strip_weak = lambda tag: tag.strip().removeprefix("W/")
+    return strip_weak(etag) in {strip_weak(tag) for tag in if_none_match.split(",")}
+
+
+async def proxy_image(request: Request, url: str, error_detail: str):
+    """Serve an upstream image through the API, answering 304 to revalidations"""
+    try:
+        entry = await fetch_image(url)
+    except Exception as e:
+        raise HTTPException(status_code=404, detail=f"{error_detail}: {str(e)}")
+
+    headers = {
+        "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
+        "Access-Control-Allow-Origin": "*",
+        "ETag": entry.etag
+    }
+    if entry.last_modified:
+        headers["Last-Modified"] = entry.last_modified
+
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=entry.content, media_type=entry.content_type, headers=headers)
 
 
 @app.get("/api/image-proxy", tags=["Utilities"])
-async def image_proxy(url: str = Query(..., description="Image URL to proxy")):
+async def image_proxy(request: Request, url: str = Query(..., description="Image URL to proxy")):
     """
     Universal image proxy endpoint - Solves CORS issues for external images
     
@@ -618,26 +751,14 @@ async def image_proxy(url: str = Query(..., description="Image URL to proxy")):
     Frontend usage:
         <img src="https://your-api.com/api/image-proxy?url=ENCODED_IMAGE_URL" />
     """
-    try:
-        response = req.get(url, timeout=10, stream=True)
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', 'image/jpeg')
-        
-        return StreamingResponse(
-            BytesIO(response.content),
-            media_type=content_type,
-            headers={
-                "Cache-Control": "public, max-age=86400",  # Cache for 24 hours
-                "Access-Control-Allow-Origin": "*"
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=404, detail=f"Image not found: {str(e)}")
+    return await proxy_image(request, url, "Image not found")
+
+
+MEMBER_IMAGE_SQL = "SELECT image_url FROM lok_sabha_members WHERE mp_code = %s"
 
 
 @app.get("/api/members/{mp_code}/image", tags=["Members"])
-def get_member_image(mp_code: int, db = Depends(get_db)):
+async def get_member_image(request: Request, mp_code: int):
     """
     Get member's profile image directly - Returns actual image file
     
@@ -653,223 +774,186 @@ def get_member_image(mp_code: int, db = Depends(get_db)):
     - Solves CORS issues
     - Caches for 24 hours
     """
-    cursor = db.cursor(dictionary=True)
-    
-    try:
-        cursor.execute("SELECT image_url FROM lok_sabha_members WHERE mp_code = %s", (mp_code,))
-        member = cursor.fetchone()
-    except:
-        cursor.execute("SELECT image_url FROM lok_sabha_members WHERE profile_link LIKE %s", (f'%/{mp_code}',))
-        member = cursor.fetchone()
-    
-    cursor.close()
+    # Cached, and the connection is released before the upstream fetch, so
+    # slow image hosts can't hold read-pool connections
+    member = await run_in_threadpool(fetch_member_row, MEMBER_IMAGE_SQL, mp_code)
     
     if not member or not member.get('image_url'):
         raise HTTPException(status_code=404, detail="Image not found")
     
-    image_url = member['image_url']
-    
-    try:
-        response = req.get(image_url, timeout=10)
-        response.raise_for_status()
-        
-        content_type = response.headers.get('content-type', 'image/jpeg')
-        
-        return Response(
-            content=response.content,
-            media_type=content_type,
-            headers={
-                "Cache-Control": "public, max-age=86400",
-                "Access-Control-Allow-Origin": "*"
-            }
-        )
-    except Exception as e:
-        raise HTTPException(status_code=404, detail=f"Failed to fetch image: {str(e)}")
+    return await proxy_image(request, member['image_url'], "Failed to fetch image")
+
+
+NEW_DATA_TABLES = [
+    'assurance', 'gallery', 'member_attendance', 'member_bills',
+    'member_committees', 'member_dashboard', 'government_bills',
+    'member_debates', 'member_other_details', 'member_personal_details',
+    'member_questions', 'member_special_mentions', 'mp_tour'
+]
+
+# Trigger-maintained counts from migrations/006
+NEW_DATA_SUMMARY_SQL = "SELECT table_name, new_count FROM new_counts"
 
+# The summary and scrape tracker only move when the scraper runs or
+# something is marked read; the mark-read endpoints reset these caches.
+# Clients and proxies may reuse a response for NEW_DATA_MAX_AGE seconds
+# and revalidate it with If-None-Match after that.
+NEW_DATA_CACHE_TTL = int(os.getenv('NEW_DATA_CACHE_TTL', 30))
+NEW_DATA_MAX_AGE = int(os.getenv('NEW_DATA_MAX_AGE', 60))
+
+class RenderedJSON(NamedTuple):
+    """A response body serialized once, with its ETag"""
+    etag: str
+    body: bytes
+
+def render_json(content) -> RenderedJSON:
+    """Serialize `content` and tag it with a hash of the bytes"""
+    body = RowJSONResponse(content).body
+    return RenderedJSON(etag=f'"{hashlib.sha1(body).hexdigest()}"', body=body)
+
+def conditional_json(request: Request, rendered: RenderedJSON):
+    """Send a RenderedJSON, or 304 when the client already has it"""
+    headers = {"Cache-Control": f"public, max-age={NEW_DATA_MAX_AGE}", "ETag": rendered.etag}
+    if etag_matches(request.headers.get("if-none-match"), rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
 
 @app.get("/api/new-data/summary", tags=["New Data"])
-def get_new_data_summary(db = Depends(get_db)):
+def get_new_data_summary(request: Request):
     """Get summary of new data across all tables"""
-    cursor = db.cursor(dictionary=True)
-    
-    tables = [
-        'assurance', 'gallery', 'member_attendance', 'member_bills',
-        'member_committees', 'member_dashboard', 'government_bills',
-        'member_debates', 'member_other_details', 'member_personal_details',
-        'member_questions', 'member_special_mentions', 'mp_tour'
+    return conditional_json(request, load_new_data_summary())
+
+@ttl_cache(seconds=NEW_DATA_CACHE_TTL)
+def load_new_data_summary():
+    """Build the get_new_data_summary response"""
+    with pooled_connection() as db:
+        counts = dict(fetch_all(db, NEW_DATA_SUMMARY_SQL))
+    
+    summary = [
+        {"table": table, "new_count": counts[table]}
+        for table in NEW_DATA_TABLES if counts.get(table, 0) > 0
     ]
-    
-    summary = []
-    for table in tables:
-        cursor.execute(f"SELECT COUNT(*) as count FROM {table} WHERE is_new = TRUE")
-        count = cursor.fetchone()['count']
-        if count > 0:
-            summary.append({"table": table, "new_count": count})
-    
-    cursor.close()
-    return {
+    return render_json({
         "total_new_records": sum(s['new_count'] for s in summary),
         "tables": summary
-    }
+    })
+
+
+def new_rows_page(db, table, key, columns, page, size, after, full):
+    """
+    One page of a table's unviewed rows, newest scrape first
+    Seeks on (scraped_at, key) when `after` is given; see migrations/005.
+    """
+    return paginate(db, table, ["is_new = TRUE"], [], None, page, size,
+                    keyset=("scraped_at", key), after=after,
+                    columns="*" if full else f"{columns}, scraped_at")
+
+NEW_ROWS_AFTER = Query(None, description="next_cursor from the previous page")
 
 
 @app.get("/api/questions/new", tags=["New Data"])
 def get_new_questions(
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
+    pagination: tuple = Depends(safe_page),
+    after: Optional[str] = NEW_ROWS_AFTER,
+    full: bool = FULL_ROWS,
+    db = Depends(get_read_db)
 ):
     """Get only NEW questions that haven't been viewed"""
-    cursor = db.cursor(dictionary=True)
-    offset = (page - 1) * size
-    
-    cursor.execute("SELECT COUNT(*) as total FROM member_questions WHERE is_new = TRUE")
-    total = cursor.fetchone()['total']
+    page, size = pagination
+    result = new_rows_page(db, "member_questions", "questionId", QUESTION_COLUMNS, page, size, after, full)
     
-    cursor.execute("""
-        SELECT * FROM member_questions 
-        WHERE is_new = TRUE 
-        ORDER BY scraped_at DESC 
-        LIMIT %s OFFSET %s
-    """, (size, offset))
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {
-        "total_new": total,
+    return RowJSONResponse({
+        "total_new": result["total"],
         "page": page,
         "size": size,
-        "pages": (total + size - 1) // size,
-        "data": data
-    }
+        "pages": result["pages"],
+        "data": result["data"],
+        "next_cursor": result["next_cursor"]
+    })
 
 
 @app.get("/api/debates/new", tags=["New Data"])
 def get_new_debates(
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
+    pagination: tuple = Depends(safe_page),
+    after: Optional[str] = NEW_ROWS_AFTER,
+    full: bool = FULL_ROWS,
+    db = Depends(get_read_db)
 ):
     """Get only NEW debates"""
-    cursor = db.cursor(dictionary=True)
-    offset = (page - 1) * size
-    
-    cursor.execute("SELECT COUNT(*) as total FROM member_debates WHERE is_new = TRUE")
-    total = cursor.fetchone()['total']
+    page, size = pagination
+    result = new_rows_page(db, "member_debates", "debateId", DEBATE_COLUMNS, page, size, after, full)
     
-    cursor.execute("""
-        SELECT * FROM member_debates 
-        WHERE is_new = TRUE 
-        ORDER BY scraped_at DESC 
-        LIMIT %s OFFSET %s
-    """, (size, offset))
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total_new": total, "page": page, "size": size, "data": data}
+    return RowJSONResponse({"total_new": result["total"], "page": page, "size": size, "data": result["data"],
+                            "next_cursor": result["next_cursor"]})
 
 
 @app.get("/api/bills/government/new", tags=["New Data"])
 def get_new_government_bills(
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
+    pagination: tuple = Depends(safe_page),
+    after: Optional[str] = NEW_ROWS_AFTER,
+    full: bool = FULL_ROWS,
+    db = Depends(get_read_db)
 ):
     """Get only NEW government bills"""
-    cursor = db.cursor(dictionary=True)
-    offset = (page - 1) * size
-    
-    cursor.execute("SELECT COUNT(*) as total FROM government_bills WHERE is_new = TRUE")
-    total = cursor.fetchone()['total']
+    page, size = pagination
+    result = new_rows_page(db, "government_bills", "id", GOVERNMENT_BILL_COLUMNS, page, size, after, full)
     
-    cursor.execute("""
-        SELECT * FROM government_bills 
-        WHERE is_new = TRUE 
-        ORDER BY scraped_at DESC 
-        LIMIT %s OFFSET %s
-    """, (size, offset))
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"total_new": total, "page": page, "size": size, "data": data}
+    return RowJSONResponse({"total_new": result["total"], "page": page, "size": size, "data": result["data"],
+                            "next_cursor": result["next_cursor"]})
 
 
 @app.get("/api/special-mentions/new", tags=["New Data"])
 def get_new_special_mentions(
-    page: int = Query(1, ge=1),
-    size: int = Query(50, ge=1, le=100),
-    db = Depends(get_db)
+    pagination: tuple = Depends(safe_page),
+    after: Optional[str] = NEW_ROWS_AFTER,
+    full: bool = FULL_ROWS,
+    db = Depends(get_read_db)
 ):
     """Get only NEW special mentions"""
-    cursor = db.cursor(dictionary=True)
-    offset = (page - 1) * size
-    
-    cursor.execute("SELECT COUNT(*) as total FROM member_special_mentions WHERE is_new = TRUE")
-    total = cursor.fetchone()['total']
-    
-    cursor.execute("""
-        SELECT * FROM member_special_mentions 
-        WHERE is_new = TRUE 
-        ORDER BY scraped_at DESC 
-        LIMIT %s OFFSET %s
-    """, (size, offset))
-    data = cursor.fetchall()
-    cursor.close()
+    page, size = pagination
+    result = new_rows_page(db, "member_special_mentions", "id", SPECIAL_MENTION_COLUMNS, page, size, after, full)
     
-    return {"total_new": total, "page": page, "size": size, "data": data}
+    return RowJSONResponse({"total_new": result["total"], "page": page, "size": size, "data": result["data"],
+                            "next_cursor": result["next_cursor"]})
+
 
+MEMBER_NEW_ACTIVITY_TABLES = {
+    'new_questions': 'member_questions',
+    'new_debates': 'member_debates',
+    'new_bills': 'member_bills',
+    'new_mentions': 'member_special_mentions',
+}
+
+MEMBER_NEW_ACTIVITIES_SQL = "SELECT table_name, new_count FROM member_new_counts WHERE mp_code = %s"
 
 @app.get("/api/members/{mp_code}/new-activities", tags=["New Data"])
-def get_member_new_activities(mp_code: int, db = Depends(get_db)):
+def get_member_new_activities(mp_code: int, db = Depends(get_read_db)):
     """Get ALL new activities for a specific member"""
-    cursor = db.cursor(dictionary=True)
-    
-    activities = {}
-    
-    cursor.execute("""
-        SELECT COUNT(*) as count FROM member_questions 
-        WHERE mp_code = %s AND is_new = TRUE
-    """, (mp_code,))
-    activities['new_questions'] = cursor.fetchone()['count']
+    counts = dict(fetch_all(db, MEMBER_NEW_ACTIVITIES_SQL, (mp_code,)))
     
-    cursor.execute("""
-        SELECT COUNT(*) as count FROM member_debates 
-        WHERE mp_code = %s AND is_new = TRUE
-    """, (mp_code,))
-    activities['new_debates'] = cursor.fetchone()['count']
+    activities = {key: counts.get(table, 0) for key, table in MEMBER_NEW_ACTIVITY_TABLES.items()}
     
-    cursor.execute("""
-        SELECT COUNT(*) as count FROM member_bills 
-        WHERE mp_code = %s AND is_new = TRUE
-    """, (mp_code,))
-    activities['new_bills'] = cursor.fetchone()['count']
-    
-    cursor.execute("""
-        SELECT COUNT(*) as count FROM member_special_mentions 
-        WHERE mp_code = %s AND is_new = TRUE
-    """, (mp_code,))
-    activities['new_mentions'] = cursor.fetchone()['count']
-    
-    cursor.close()
-    
-    return {
+    return RowJSONResponse({
         "mp_code": mp_code,
         "activities": activities,
         "total_new": sum(activities.values())
-    }
+    })
 
 
 @app.post("/api/questions/{question_id}/mark-read", tags=["New Data"])
-def mark_question_read(question_id: int, db = Depends(get_db)):
+def mark_question_read(question_id: int, db = Depends(get_write_db)):
     """Mark a question as read (not new anymore)"""
     cursor = db.cursor()
     cursor.execute("""
         UPDATE member_questions 
         SET is_new = FALSE 
-        WHERE questionId = %s
+        WHERE questionId = %s AND is_new = TRUE
     """, (question_id,))
-    db.commit()
     affected = cursor.rowcount
+    # Nothing changed on a miss, so there is nothing to commit or invalidate
+    if affected:
+        db.commit()
+        forget_new_data()
     cursor.close()
     
     if affected == 0:
@@ -879,16 +963,19 @@ def mark_question_read(question_id: int, db = Depends(get_db)):
 
 
 @app.post("/api/debates/{debate_id}/mark-read", tags=["New Data"])
-def mark_debate_read(debate_id: int, db = Depends(get_db)):
+def mark_debate_read(debate_id: int, db = Depends(get_write_db)):
     """Mark a debate as read"""
     cursor = db.cursor()
     cursor.execute("""
         UPDATE member_debates 
         SET is_new = FALSE 
-        WHERE debateId = %s
+        WHERE debateId = %s AND is_new = TRUE
     """, (debate_id,))
-    db.commit()
     affected = cursor.rowcount
+    # Nothing changed on a miss, so there is nothing to commit or invalidate
+    if affected:
+        db.commit()
+        forget_new_data()
     cursor.close()
     
     if affected == 0:
@@ -897,52 +984,155 @@ def mark_debate_read(debate_id: int, db = Depends(get_db)):
     return {"status": "success", "message": "Debate marked as read"}
 
 
-@app.post("/api/new-data/mark-all-read/{table_name}", tags=["New Data"])
-def mark_all_read(table_name: str, db = Depends(get_db)):
-    """Mark all records in a table as read (is_new = FALSE)"""
-    allowed_tables = [
-        'member_questions', 'member_debates', 'member_special_mentions',
-        'government_bills', 'member_bills', 'assurance', 'gallery'
-    ]
-    
-    if table_name not in allowed_tables:
+# Tables that can be cleared in bulk -> primary key. Batches go in
+# (scraped_at, key) order, a total order the is_new indexes from
+# migrations/005 and 007 serve, so each UPDATE ... LIMIT only touches the
+# rows it changes and is deterministic for replication.
+MARK_ALL_READ_TABLES = {
+    'member_questions': 'questionId',
+    'member_debates': 'debateId',
+    'member_special_mentions': 'id',
+    'government_bills': 'id',
+    'member_bills': 'id',
+    'assurance': 'id',
+    'gallery': 'id',
+}
+MARK_ALL_READ_BATCH = int(os.getenv('MARK_ALL_READ_BATCH', 5000))
+
+# A running task whose row hasn't moved for this long is reported as
+# failed: its worker died, or couldn't record the error
+MARK_ALL_READ_STALL_SECONDS = int(os.getenv('MARK_ALL_READ_STALL_SECONDS', 300))
+
+# Job progress is kept in mark_all_read_tasks (migrations/008) so any
+# worker can answer a status poll; finished jobs are kept for a day
+MARK_ALL_READ_TASK_SQL = """
+    SELECT task_id,
+           IF(stalled, 'failed', status) AS status,
+           table_name AS `table`,
+           records_marked,
+           IF(stalled, 'Task stopped responding', error) AS error
+    FROM (
+        SELECT *, status = 'running' AND updated_at < NOW() - INTERVAL %s SECOND AS stalled
+        FROM mark_all_read_tasks WHERE task_id = %s
+    ) task
+"""
+
+def mark_all_read_batches(task_id: str, table_name: str):
+    """
+    Clear is_new on `table_name` MARK_ALL_READ_BATCH rows at a time,
+    committing after each batch so row locks are only held briefly
+    """
+    update_sql = (f"UPDATE {table_name} SET is_new = FALSE WHERE is_new = TRUE "
+                  f"ORDER BY scraped_at DESC, {MARK_ALL_READ_TABLES[table_name]} DESC LIMIT %s")
+    try:
+        while True:
+            # One checkout per batch, so a long job doesn't pin one of the
+            # few write connections between batches
+            with pooled_connection(write_pool) as db:
+                cursor = db.cursor()
+                cursor.execute(update_sql, (MARK_ALL_READ_BATCH,))
+                affected = cursor.rowcount
+                done = affected < MARK_ALL_READ_BATCH
+                cursor.execute(
+                    "UPDATE mark_all_read_tasks SET records_marked = records_marked + %s, status = %s "
+                    "WHERE task_id = %s",
+                    (affected, "success" if done else "running", task_id)
+                )
+                db.commit()
+                cursor.close()
+            if affected:
+                forget_new_data()
+            if done:
+                break
+    except Exception as e:
+        try:
+            with pooled_connection(write_pool) as db:
+                cursor = db.cursor()
+                cursor.execute(
+                    "UPDATE mark_all_read_tasks SET status = 'failed', error = %s WHERE task_id = %s",
+                    (str(e), task_id)
+                )
+                db.commit()
+                cursor.close()
+        except Exception:
+            pass  # reported as failed once MARK_ALL_READ_STALL_SECONDS pass
+
+
+@app.post("/api/new-data/mark-all-read/{table_name}", status_code=202, tags=["New Data"])
+def mark_all_read(table_name: str, background_tasks: BackgroundTasks, db = Depends(get_write_db)):
+    """
+    Mark all records in a table as read (is_new = FALSE)
+    Runs in the background; poll the returned task's status endpoint.
+    """
+    if table_name not in MARK_ALL_READ_TABLES:
         raise HTTPException(status_code=400, detail="Invalid table name")
     
+    task_id = uuid.uuid4().hex
     cursor = db.cursor()
-    cursor.execute(f"UPDATE {table_name} SET is_new = FALSE WHERE is_new = TRUE")
+    cursor.execute("DELETE FROM mark_all_read_tasks WHERE created_at < NOW() - INTERVAL 1 DAY")
+    cursor.execute(
+        "INSERT INTO mark_all_read_tasks (task_id, table_name) VALUES (%s, %s)",
+        (task_id, table_name)
+    )
     db.commit()
-    affected = cursor.rowcount
     cursor.close()
+    background_tasks.add_task(mark_all_read_batches, task_id, table_name)
     
     return {
-        "status": "success",
+        "task_id": task_id,
+        "status": "running",
         "table": table_name,
-        "records_marked": affected
+        "records_marked": 0,
+        "error": None
     }
 
 
+@app.get("/api/new-data/mark-all-read/{task_id}/status", tags=["New Data"])
+def get_mark_all_read_status(task_id: str, db = Depends(get_read_db)):
+    """Get the progress of a mark-all-read task"""
+    rows = fetch_all(db, MARK_ALL_READ_TASK_SQL, (MARK_ALL_READ_STALL_SECONDS, task_id), dictionary=True)
+    if not rows:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return RowJSONResponse(rows[0])
+
+
 @app.get("/api/scrape-tracker", tags=["New Data"])
-def get_scrape_tracker(db = Depends(get_db)):
+def get_scrape_tracker(request: Request):
     """Get scraping statistics for all tables"""
-    cursor = db.cursor(dictionary=True)
-    cursor.execute("""
-        SELECT 
-            table_name,
-            last_max_id,
-            last_scrape_time,
-            new_records_count,
-            total_records,
-            scrape_status
-        FROM scrape_tracker
-        ORDER BY last_scrape_time DESC
-    """)
-    data = cursor.fetchall()
-    cursor.close()
-    
-    return {"trackers": data}
+    return conditional_json(request, load_scrape_tracker())
+
+@ttl_cache(seconds=NEW_DATA_CACHE_TTL)
+def load_scrape_tracker():
+    """Build the get_scrape_tracker response"""
+    with pooled_connection() as db:
+        data = fetch_all(db, """
+            SELECT 
+                table_name,
+                last_max_id,
+                last_scrape_time,
+                new_records_count,
+                total_records,
+                scrape_status
+            FROM scrape_tracker
+            ORDER BY last_scrape_time DESC
+        """, dictionary=True)
+    
+    return render_json({"trackers": data})
+
+def forget_new_data():
+    """Drop cached responses that show is_new after rows were marked read"""
+    load_new_data_summary.cache_clear()
+    load_scrape_tracker.cache_clear()
+    with list_page_cache_lock:
+        list_page_cache.clear()
 
 if __name__ == "__main__":
     import uvicorn
     port = int(os.getenv('PORT', 8000))
     host = os.getenv('HOST', '127.0.0.1')
-    uvicorn.run(app, host=host, port=port)
\ No newline at end of file
+    # Same variable the uvicorn CLI reads. Every worker opens its own
+    # DB_POOL_SIZE + DB_WRITE_POOL_SIZE connections, so size
+    # max_connections on the server to match.
+    workers = int(os.getenv('WEB_CONCURRENCY', 1))
+    # uvicorn[standard] installs uvloop and httptools, which "auto" picks
+    uvicorn.run("main:app", host=host, port=port, workers=workers, loop="auto", http="auto")
\ No newline at end of file
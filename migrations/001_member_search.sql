@@ -0,0 +1,74 @@
+-- ============================================================
+-- 001: Indexed member search
+-- ============================================================
+-- get_members used unanchored LIKE '%x%' filters, which can't use any
+-- index, and matched Lok Sabha terms by substring ('%7%' also hit 17).
+--
+-- Note: InnoDB never indexes words shorter than innodb_ft_min_token_size
+-- (default 3) or on its stopword list ("of", "the", ...). get_members
+-- matches those words with REGEXP instead; set FULLTEXT_MIN_TOKEN_SIZE if
+-- the server setting is changed and these indexes rebuilt.
+
+ALTER TABLE lok_sabha_members
+    ADD FULLTEXT KEY ft_party (party),
+    ADD FULLTEXT KEY ft_state (state),
+    ADD FULLTEXT KEY ft_search (name, constituency, party, state);
+
+-- One row per (member, Lok Sabha term), replacing LIKE on the terms string
+CREATE TABLE IF NOT EXISTS mp_terms (
+    mp_code INT NOT NULL,
+    term INT NOT NULL,
+    PRIMARY KEY (mp_code, term),
+    KEY idx_mp_terms_term (term, mp_code)
+);
+
+-- Backfill from every number that appears in lok_sabha_members.terms
+INSERT IGNORE INTO mp_terms (mp_code, term)
+WITH RECURSIVE seq (n) AS (
+    SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < 20
+)
+SELECT m.mp_code, CAST(REGEXP_SUBSTR(m.terms, '[0-9]+', 1, seq.n) AS UNSIGNED)
+FROM lok_sabha_members m
+JOIN seq
+WHERE m.mp_code IS NOT NULL
+  AND REGEXP_SUBSTR(m.terms, '[0-9]+', 1, seq.n) IS NOT NULL;
+
+-- Keep mp_terms in step with whatever the scraper writes to terms
+DELIMITER //
+
+CREATE TRIGGER trg_members_terms_ai AFTER INSERT ON lok_sabha_members
+FOR EACH ROW
+BEGIN
+    INSERT IGNORE INTO mp_terms (mp_code, term)
+    WITH RECURSIVE seq (n) AS (
+        SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < 20
+    )
+    SELECT NEW.mp_code, CAST(REGEXP_SUBSTR(NEW.terms, '[0-9]+', 1, seq.n) AS UNSIGNED)
+    FROM seq
+    WHERE NEW.mp_code IS NOT NULL
+      AND REGEXP_SUBSTR(NEW.terms, '[0-9]+', 1, seq.n) IS NOT NULL;
+END//
+
+CREATE TRIGGER trg_members_terms_au AFTER UPDATE ON lok_sabha_members
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.terms <=> NEW.terms) OR NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        DELETE FROM mp_terms WHERE mp_code = OLD.mp_code;
+        INSERT IGNORE INTO mp_terms (mp_code, term)
+        WITH RECURSIVE seq (n) AS (
+            SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < 20
+        )
+        SELECT NEW.mp_code, CAST(REGEXP_SUBSTR(NEW.terms, '[0-9]+', 1, seq.n) AS UNSIGNED)
+        FROM seq
+        WHERE NEW.mp_code IS NOT NULL
+          AND REGEXP_SUBSTR(NEW.terms, '[0-9]+', 1, seq.n) IS NOT NULL;
+    END IF;
+END//
+
+CREATE TRIGGER trg_members_terms_ad AFTER DELETE ON lok_sabha_members
+FOR EACH ROW
+BEGIN
+    DELETE FROM mp_terms WHERE mp_code = OLD.mp_code;
+END//
+
+DELIMITER ;
@@ -0,0 +1,18 @@
+-- ============================================================
+-- 002: Composite indexes for the paginated list endpoints
+-- ============================================================
+-- Each index leads with the column the mp_code filter applies to, then
+-- follows the endpoint's ORDER BY (including the keyset tie-breaker), so
+-- filtering, the optional loksabha predicate and the sort are all served
+-- by one range scan instead of an index lookup followed by a filesort.
+
+CREATE INDEX idx_assurance_member_order ON assurance (mp_code, loksabha DESC, session DESC, id DESC);
+CREATE INDEX idx_gallery_member_order ON gallery (mp_code, eventDate DESC, id DESC);
+CREATE INDEX idx_committees_member_order ON member_committees (mp_code, loksabha DESC, id DESC);
+CREATE INDEX idx_member_bills_member_order ON member_bills (mp_code, loksabha DESC, id DESC);
+CREATE INDEX idx_government_bills_member_order ON government_bills (srno, loksabha DESC, id DESC);
+CREATE INDEX idx_questions_member_order ON member_questions (srno, questionDate DESC, questionId DESC);
+CREATE INDEX idx_debates_member_order ON member_debates (srno, loksabha DESC, debateId DESC);
+CREATE INDEX idx_special_mentions_member_order ON member_special_mentions (srno, madeDate DESC, id DESC);
+CREATE INDEX idx_tour_member_order ON mp_tour (srno, tour_date DESC, id DESC);
+CREATE INDEX idx_attendance_member ON member_attendance (mp_code, loksabha DESC, id DESC);
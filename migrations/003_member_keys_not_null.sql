@@ -0,0 +1,32 @@
+-- ============================================================
+-- 003: Make the member key NOT NULL on the per-member fact tables
+-- ============================================================
+-- Rows without an mp_code/srno can never be returned by a member
+-- filter and were only hidden by "IS NOT NULL" guards in every list
+-- query. Drop the orphans and let the schema enforce the key instead.
+-- (assurance and gallery legitimately hold rows not tied to a member
+-- and stay nullable.)
+
+DELETE FROM member_committees WHERE mp_code IS NULL;
+ALTER TABLE member_committees MODIFY mp_code INT NOT NULL;
+
+DELETE FROM member_bills WHERE mp_code IS NULL;
+ALTER TABLE member_bills MODIFY mp_code INT NOT NULL;
+
+DELETE FROM member_attendance WHERE mp_code IS NULL;
+ALTER TABLE member_attendance MODIFY mp_code INT NOT NULL;
+
+DELETE FROM government_bills WHERE srno IS NULL;
+ALTER TABLE government_bills MODIFY srno INT NOT NULL;
+
+DELETE FROM member_questions WHERE srno IS NULL;
+ALTER TABLE member_questions MODIFY srno INT NOT NULL;
+
+DELETE FROM member_debates WHERE srno IS NULL;
+ALTER TABLE member_debates MODIFY srno INT NOT NULL;
+
+DELETE FROM member_special_mentions WHERE srno IS NULL;
+ALTER TABLE member_special_mentions MODIFY srno INT NOT NULL;
+
+DELETE FROM mp_tour WHERE srno IS NULL;
+ALTER TABLE mp_tour MODIFY srno INT NOT NULL;
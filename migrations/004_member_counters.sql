@@ -0,0 +1,154 @@
+-- ============================================================
+-- 004: Per-member activity counters for the profile endpoint
+-- ============================================================
+-- get_complete_profile counted six fact tables on every view. Keep the
+-- counts on lok_sabha_members instead, maintained by triggers on the fact
+-- tables, so the profile is a single primary-key row fetch.
+-- (member_questions/member_debates key members by srno, which holds the
+-- member's mp_code.)
+
+ALTER TABLE lok_sabha_members
+    ADD COLUMN cnt_assurances INT NOT NULL DEFAULT 0,
+    ADD COLUMN cnt_gallery INT NOT NULL DEFAULT 0,
+    ADD COLUMN cnt_bills INT NOT NULL DEFAULT 0,
+    ADD COLUMN cnt_committees INT NOT NULL DEFAULT 0,
+    ADD COLUMN cnt_questions INT NOT NULL DEFAULT 0,
+    ADD COLUMN cnt_debates INT NOT NULL DEFAULT 0;
+
+UPDATE lok_sabha_members m SET
+    cnt_assurances = (SELECT COUNT(*) FROM assurance x WHERE x.mp_code = m.mp_code),
+    cnt_gallery = (SELECT COUNT(*) FROM gallery x WHERE x.mp_code = m.mp_code),
+    cnt_bills = (SELECT COUNT(*) FROM member_bills x WHERE x.mp_code = m.mp_code),
+    cnt_committees = (SELECT COUNT(*) FROM member_committees x WHERE x.mp_code = m.mp_code),
+    cnt_questions = (SELECT COUNT(*) FROM member_questions x WHERE x.srno = m.mp_code),
+    cnt_debates = (SELECT COUNT(*) FROM member_debates x WHERE x.srno = m.mp_code);
+
+DELIMITER //
+
+CREATE TRIGGER trg_assurance_cnt_ai AFTER INSERT ON assurance
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_assurances = cnt_assurances + 1 WHERE mp_code = NEW.mp_code;
+END//
+
+CREATE TRIGGER trg_assurance_cnt_ad AFTER DELETE ON assurance
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_assurances = cnt_assurances - 1 WHERE mp_code = OLD.mp_code;
+END//
+
+CREATE TRIGGER trg_assurance_cnt_au AFTER UPDATE ON assurance
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE lok_sabha_members SET cnt_assurances = cnt_assurances - 1 WHERE mp_code = OLD.mp_code;
+        UPDATE lok_sabha_members SET cnt_assurances = cnt_assurances + 1 WHERE mp_code = NEW.mp_code;
+    END IF;
+END//
+
+CREATE TRIGGER trg_gallery_cnt_ai AFTER INSERT ON gallery
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_gallery = cnt_gallery + 1 WHERE mp_code = NEW.mp_code;
+END//
+
+CREATE TRIGGER trg_gallery_cnt_ad AFTER DELETE ON gallery
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_gallery = cnt_gallery - 1 WHERE mp_code = OLD.mp_code;
+END//
+
+CREATE TRIGGER trg_gallery_cnt_au AFTER UPDATE ON gallery
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE lok_sabha_members SET cnt_gallery = cnt_gallery - 1 WHERE mp_code = OLD.mp_code;
+        UPDATE lok_sabha_members SET cnt_gallery = cnt_gallery + 1 WHERE mp_code = NEW.mp_code;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_bills_cnt_ai AFTER INSERT ON member_bills
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_bills = cnt_bills + 1 WHERE mp_code = NEW.mp_code;
+END//
+
+CREATE TRIGGER trg_member_bills_cnt_ad AFTER DELETE ON member_bills
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_bills = cnt_bills - 1 WHERE mp_code = OLD.mp_code;
+END//
+
+CREATE TRIGGER trg_member_bills_cnt_au AFTER UPDATE ON member_bills
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE lok_sabha_members SET cnt_bills = cnt_bills - 1 WHERE mp_code = OLD.mp_code;
+        UPDATE lok_sabha_members SET cnt_bills = cnt_bills + 1 WHERE mp_code = NEW.mp_code;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_committees_cnt_ai AFTER INSERT ON member_committees
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_committees = cnt_committees + 1 WHERE mp_code = NEW.mp_code;
+END//
+
+CREATE TRIGGER trg_member_committees_cnt_ad AFTER DELETE ON member_committees
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_committees = cnt_committees - 1 WHERE mp_code = OLD.mp_code;
+END//
+
+CREATE TRIGGER trg_member_committees_cnt_au AFTER UPDATE ON member_committees
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE lok_sabha_members SET cnt_committees = cnt_committees - 1 WHERE mp_code = OLD.mp_code;
+        UPDATE lok_sabha_members SET cnt_committees = cnt_committees + 1 WHERE mp_code = NEW.mp_code;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_questions_cnt_ai AFTER INSERT ON member_questions
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_questions = cnt_questions + 1 WHERE mp_code = NEW.srno;
+END//
+
+CREATE TRIGGER trg_member_questions_cnt_ad AFTER DELETE ON member_questions
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_questions = cnt_questions - 1 WHERE mp_code = OLD.srno;
+END//
+
+CREATE TRIGGER trg_member_questions_cnt_au AFTER UPDATE ON member_questions
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.srno <=> NEW.srno) THEN
+        UPDATE lok_sabha_members SET cnt_questions = cnt_questions - 1 WHERE mp_code = OLD.srno;
+        UPDATE lok_sabha_members SET cnt_questions = cnt_questions + 1 WHERE mp_code = NEW.srno;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_debates_cnt_ai AFTER INSERT ON member_debates
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_debates = cnt_debates + 1 WHERE mp_code = NEW.srno;
+END//
+
+CREATE TRIGGER trg_member_debates_cnt_ad AFTER DELETE ON member_debates
+FOR EACH ROW
+BEGIN
+    UPDATE lok_sabha_members SET cnt_debates = cnt_debates - 1 WHERE mp_code = OLD.srno;
+END//
+
+CREATE TRIGGER trg_member_debates_cnt_au AFTER UPDATE ON member_debates
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.srno <=> NEW.srno) THEN
+        UPDATE lok_sabha_members SET cnt_debates = cnt_debates - 1 WHERE mp_code = OLD.srno;
+        UPDATE lok_sabha_members SET cnt_debates = cnt_debates + 1 WHERE mp_code = NEW.srno;
+    END IF;
+END//
+
+DELIMITER ;
@@ -0,0 +1,11 @@
+-- ============================================================
+-- 005: Seek indexes for the "new" listings
+-- ============================================================
+-- /api/*/new filter on is_new and page newest-scrape-first with a
+-- (scraped_at, primary key) cursor, so each page is one range scan
+-- instead of skipping OFFSET rows.
+
+CREATE INDEX idx_questions_new_seek ON member_questions (is_new, scraped_at DESC, questionId DESC);
+CREATE INDEX idx_debates_new_seek ON member_debates (is_new, scraped_at DESC, debateId DESC);
+CREATE INDEX idx_government_bills_new_seek ON government_bills (is_new, scraped_at DESC, id DESC);
+CREATE INDEX idx_special_mentions_new_seek ON member_special_mentions (is_new, scraped_at DESC, id DESC);
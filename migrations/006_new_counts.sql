@@ -0,0 +1,403 @@
+-- ============================================================
+-- 006: Materialized counts of unviewed ("is_new") rows
+-- ============================================================
+-- /api/new-data/summary and /api/members/{mp_code}/new-activities
+-- counted is_new rows in every table per request. Keep the counts in
+-- new_counts (per table) and member_new_counts (per member and table),
+-- maintained by triggers whenever a row is inserted, deleted or has
+-- is_new flipped (which covers the scraper and the mark-read endpoints).
+--
+-- Run with the scraper paused so the backfill and triggers start in step.
+
+CREATE TABLE IF NOT EXISTS new_counts (
+    table_name VARCHAR(64) NOT NULL PRIMARY KEY,
+    new_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS member_new_counts (
+    mp_code INT NOT NULL,
+    table_name VARCHAR(64) NOT NULL,
+    new_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (mp_code, table_name)
+);
+
+REPLACE INTO new_counts (table_name, new_count)
+SELECT 'assurance', COUNT(*) FROM assurance WHERE is_new = TRUE
+UNION ALL SELECT 'gallery', COUNT(*) FROM gallery WHERE is_new = TRUE
+UNION ALL SELECT 'member_attendance', COUNT(*) FROM member_attendance WHERE is_new = TRUE
+UNION ALL SELECT 'member_bills', COUNT(*) FROM member_bills WHERE is_new = TRUE
+UNION ALL SELECT 'member_committees', COUNT(*) FROM member_committees WHERE is_new = TRUE
+UNION ALL SELECT 'member_dashboard', COUNT(*) FROM member_dashboard WHERE is_new = TRUE
+UNION ALL SELECT 'government_bills', COUNT(*) FROM government_bills WHERE is_new = TRUE
+UNION ALL SELECT 'member_debates', COUNT(*) FROM member_debates WHERE is_new = TRUE
+UNION ALL SELECT 'member_other_details', COUNT(*) FROM member_other_details WHERE is_new = TRUE
+UNION ALL SELECT 'member_personal_details', COUNT(*) FROM member_personal_details WHERE is_new = TRUE
+UNION ALL SELECT 'member_questions', COUNT(*) FROM member_questions WHERE is_new = TRUE
+UNION ALL SELECT 'member_special_mentions', COUNT(*) FROM member_special_mentions WHERE is_new = TRUE
+UNION ALL SELECT 'mp_tour', COUNT(*) FROM mp_tour WHERE is_new = TRUE;
+
+REPLACE INTO member_new_counts (mp_code, table_name, new_count)
+SELECT mp_code, 'member_questions', COUNT(*) FROM member_questions WHERE is_new = TRUE AND mp_code IS NOT NULL GROUP BY mp_code
+UNION ALL SELECT mp_code, 'member_debates', COUNT(*) FROM member_debates WHERE is_new = TRUE AND mp_code IS NOT NULL GROUP BY mp_code
+UNION ALL SELECT mp_code, 'member_bills', COUNT(*) FROM member_bills WHERE is_new = TRUE AND mp_code IS NOT NULL GROUP BY mp_code
+UNION ALL SELECT mp_code, 'member_special_mentions', COUNT(*) FROM member_special_mentions WHERE is_new = TRUE AND mp_code IS NOT NULL GROUP BY mp_code;
+
+DELIMITER //
+
+CREATE TRIGGER trg_assurance_new_ai AFTER INSERT ON assurance
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'assurance';
+END//
+
+CREATE TRIGGER trg_assurance_new_ad AFTER DELETE ON assurance
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'assurance';
+END//
+
+CREATE TRIGGER trg_assurance_new_au AFTER UPDATE ON assurance
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'assurance';
+    END IF;
+END//
+
+CREATE TRIGGER trg_gallery_new_ai AFTER INSERT ON gallery
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'gallery';
+END//
+
+CREATE TRIGGER trg_gallery_new_ad AFTER DELETE ON gallery
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'gallery';
+END//
+
+CREATE TRIGGER trg_gallery_new_au AFTER UPDATE ON gallery
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'gallery';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_attendance_new_ai AFTER INSERT ON member_attendance
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_attendance';
+END//
+
+CREATE TRIGGER trg_member_attendance_new_ad AFTER DELETE ON member_attendance
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_attendance';
+END//
+
+CREATE TRIGGER trg_member_attendance_new_au AFTER UPDATE ON member_attendance
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_attendance';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_bills_new_ai AFTER INSERT ON member_bills
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_bills';
+    IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+        INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_bills', 1)
+        ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_bills_new_ad AFTER DELETE ON member_bills
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_bills';
+    UPDATE member_new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_bills';
+END//
+
+CREATE TRIGGER trg_member_bills_new_au AFTER UPDATE ON member_bills
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_bills';
+    END IF;
+    IF NOT (OLD.is_new <=> NEW.is_new) OR NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE member_new_counts SET new_count = new_count - 1
+        WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_bills';
+        IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+            INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_bills', 1)
+            ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+        END IF;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_committees_new_ai AFTER INSERT ON member_committees
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_committees';
+END//
+
+CREATE TRIGGER trg_member_committees_new_ad AFTER DELETE ON member_committees
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_committees';
+END//
+
+CREATE TRIGGER trg_member_committees_new_au AFTER UPDATE ON member_committees
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_committees';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_dashboard_new_ai AFTER INSERT ON member_dashboard
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_dashboard';
+END//
+
+CREATE TRIGGER trg_member_dashboard_new_ad AFTER DELETE ON member_dashboard
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_dashboard';
+END//
+
+CREATE TRIGGER trg_member_dashboard_new_au AFTER UPDATE ON member_dashboard
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_dashboard';
+    END IF;
+END//
+
+CREATE TRIGGER trg_government_bills_new_ai AFTER INSERT ON government_bills
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'government_bills';
+END//
+
+CREATE TRIGGER trg_government_bills_new_ad AFTER DELETE ON government_bills
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'government_bills';
+END//
+
+CREATE TRIGGER trg_government_bills_new_au AFTER UPDATE ON government_bills
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'government_bills';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_debates_new_ai AFTER INSERT ON member_debates
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_debates';
+    IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+        INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_debates', 1)
+        ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_debates_new_ad AFTER DELETE ON member_debates
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_debates';
+    UPDATE member_new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_debates';
+END//
+
+CREATE TRIGGER trg_member_debates_new_au AFTER UPDATE ON member_debates
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_debates';
+    END IF;
+    IF NOT (OLD.is_new <=> NEW.is_new) OR NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE member_new_counts SET new_count = new_count - 1
+        WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_debates';
+        IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+            INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_debates', 1)
+            ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+        END IF;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_other_details_new_ai AFTER INSERT ON member_other_details
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_other_details';
+END//
+
+CREATE TRIGGER trg_member_other_details_new_ad AFTER DELETE ON member_other_details
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_other_details';
+END//
+
+CREATE TRIGGER trg_member_other_details_new_au AFTER UPDATE ON member_other_details
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_other_details';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_personal_details_new_ai AFTER INSERT ON member_personal_details
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_personal_details';
+END//
+
+CREATE TRIGGER trg_member_personal_details_new_ad AFTER DELETE ON member_personal_details
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_personal_details';
+END//
+
+CREATE TRIGGER trg_member_personal_details_new_au AFTER UPDATE ON member_personal_details
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_personal_details';
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_questions_new_ai AFTER INSERT ON member_questions
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_questions';
+    IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+        INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_questions', 1)
+        ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_questions_new_ad AFTER DELETE ON member_questions
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_questions';
+    UPDATE member_new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_questions';
+END//
+
+CREATE TRIGGER trg_member_questions_new_au AFTER UPDATE ON member_questions
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_questions';
+    END IF;
+    IF NOT (OLD.is_new <=> NEW.is_new) OR NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE member_new_counts SET new_count = new_count - 1
+        WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_questions';
+        IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+            INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_questions', 1)
+            ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+        END IF;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_special_mentions_new_ai AFTER INSERT ON member_special_mentions
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'member_special_mentions';
+    IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+        INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_special_mentions', 1)
+        ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+    END IF;
+END//
+
+CREATE TRIGGER trg_member_special_mentions_new_ad AFTER DELETE ON member_special_mentions
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'member_special_mentions';
+    UPDATE member_new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_special_mentions';
+END//
+
+CREATE TRIGGER trg_member_special_mentions_new_au AFTER UPDATE ON member_special_mentions
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'member_special_mentions';
+    END IF;
+    IF NOT (OLD.is_new <=> NEW.is_new) OR NOT (OLD.mp_code <=> NEW.mp_code) THEN
+        UPDATE member_new_counts SET new_count = new_count - 1
+        WHERE OLD.is_new AND mp_code = OLD.mp_code AND table_name = 'member_special_mentions';
+        IF NEW.is_new AND NEW.mp_code IS NOT NULL THEN
+            INSERT INTO member_new_counts (mp_code, table_name, new_count) VALUES (NEW.mp_code, 'member_special_mentions', 1)
+            ON DUPLICATE KEY UPDATE new_count = new_count + 1;
+        END IF;
+    END IF;
+END//
+
+CREATE TRIGGER trg_mp_tour_new_ai AFTER INSERT ON mp_tour
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count + 1
+    WHERE NEW.is_new AND table_name = 'mp_tour';
+END//
+
+CREATE TRIGGER trg_mp_tour_new_ad AFTER DELETE ON mp_tour
+FOR EACH ROW
+BEGIN
+    UPDATE new_counts SET new_count = new_count - 1
+    WHERE OLD.is_new AND table_name = 'mp_tour';
+END//
+
+CREATE TRIGGER trg_mp_tour_new_au AFTER UPDATE ON mp_tour
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.is_new <=> NEW.is_new) THEN
+        UPDATE new_counts SET new_count = new_count + (NEW.is_new IS TRUE) - (OLD.is_new IS TRUE)
+        WHERE table_name = 'mp_tour';
+    END IF;
+END//
+
+DELIMITER ;
@@ -0,0 +1,12 @@
+-- ============================================================
+-- 007: is_new indexes for the remaining mark-all-read tables
+-- ============================================================
+-- MySQL has no partial indexes, so is_new leads. 005 covered the four
+-- tables with /new listings; these are the other tables that
+-- /api/new-data/mark-all-read clears with "WHERE is_new = TRUE", which
+-- otherwise scans the whole table to find the few unread rows. Like 005
+-- they end in the primary key, matching the batches' ORDER BY.
+
+CREATE INDEX idx_member_bills_new ON member_bills (is_new, scraped_at DESC, id DESC);
+CREATE INDEX idx_assurance_new ON assurance (is_new, scraped_at DESC, id DESC);
+CREATE INDEX idx_gallery_new ON gallery (is_new, scraped_at DESC, id DESC);
@@ -0,0 +1,18 @@
+-- ============================================================
+-- 008: Shared state for mark-all-read jobs
+-- ============================================================
+-- Job progress lived in one worker's memory, so with WEB_CONCURRENCY > 1
+-- a status poll that reached another worker got a 404. The worker running
+-- a job updates its row in the same transaction as each batch.
+
+CREATE TABLE IF NOT EXISTS mark_all_read_tasks (
+    task_id CHAR(32) NOT NULL PRIMARY KEY,
+    table_name VARCHAR(64) NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'running',
+    records_marked BIGINT NOT NULL DEFAULT 0,
+    error TEXT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    -- Moves with every batch; a running task that stops moving has died
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    KEY idx_mark_all_read_tasks_created (created_at)
+);
@@ -0,0 +1,14 @@
+-- ============================================================
+-- 009: Sort-order indexes for unfiltered list pages
+-- ============================================================
+-- Every 002 index leads with the member column, so a list page with no
+-- mp_code filter (including each ?after= page of a deep walk) had to
+-- scan and sort the whole table. These follow the keyset order alone, so
+-- a seek reads only the rows it returns.
+
+CREATE INDEX idx_questions_order ON member_questions (questionDate DESC, questionId DESC);
+CREATE INDEX idx_debates_order ON member_debates (loksabha DESC, debateId DESC);
+CREATE INDEX idx_gallery_order ON gallery (eventDate DESC, id DESC);
+CREATE INDEX idx_assurance_order ON assurance (loksabha DESC, session DESC, id DESC);
+CREATE INDEX idx_special_mentions_order ON member_special_mentions (madeDate DESC, id DESC);
+CREATE INDEX idx_tour_order ON mp_tour (tour_date DESC, id DESC);
@@ -4,21 +4,35 @@ models.py
 Pydantic models for request/response validation
 """
 
-from pydantic import BaseModel
-from typing import Optional, List, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Any, Union
 from datetime import date, datetime
 
+# ============================================================
+# BASE MODELS
+# ============================================================
+
+class _ORMBase(BaseModel):
+    """Base for the table row models; schemas are built on first use, not at import"""
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
 # ============================================================
 # RESPONSE MODELS
 # ============================================================
 
+class ColumnarRows(BaseModel):
+    """A page of rows sent as one column list plus value lists (?columnar=true)"""
+    columns: List[str]
+    rows: List[List[Any]]
+
 class PaginatedResponse(BaseModel):
-    """Standard paginated response"""
-    total: int
-    page: int
+    """Standard paginated response (total/page/pages are null on cursor pages)"""
+    total: Optional[int] = None
+    page: Optional[int] = None
     size: int
-    pages: int
-    data: List[Any]
+    pages: Optional[int] = None
+    data: Union[List[Any], ColumnarRows]
+    next_cursor: Optional[str] = None
 
 class HealthResponse(BaseModel):
     """Health check response"""
@@ -30,7 +44,7 @@ class HealthResponse(BaseModel):
 # MEMBER MODELS
 # ============================================================
 
-class Member(BaseModel):
+class Member(_ORMBase):
     """Lok Sabha Member"""
     mp_code: Optional[int] = None
     name: Optional[str] = None
@@ -43,9 +57,6 @@ class Member(BaseModel):
     status: Optional[str] = None
     profile_link: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 class MemberProfile(BaseModel):
     """Complete member profile with statistics"""
     member: dict
@@ -55,7 +66,7 @@ class MemberProfile(BaseModel):
 # ASSURANCE MODELS
 # ============================================================
 
-class Assurance(BaseModel):
+class Assurance(_ORMBase):
     """Government assurance"""
     id: Optional[int] = None
     mp_code: Optional[int] = None
@@ -66,14 +77,11 @@ class Assurance(BaseModel):
     ministry: Optional[str] = None
     status: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # GALLERY MODELS
 # ============================================================
 
-class Gallery(BaseModel):
+class Gallery(_ORMBase):
     """Video gallery"""
     id: Optional[int] = None
     mp_code: Optional[int] = None
@@ -84,14 +92,11 @@ class Gallery(BaseModel):
     videoUrl: Optional[str] = None
     eventDate: Optional[date] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # COMMITTEE MODELS
 # ============================================================
 
-class Committee(BaseModel):
+class Committee(_ORMBase):
     """Committee membership"""
     id: Optional[int] = None
     mp_code: Optional[int] = None
@@ -101,14 +106,11 @@ class Committee(BaseModel):
     date_from: Optional[date] = None
     date_to: Optional[date] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # BILL MODELS
 # ============================================================
 
-class PrivateBill(BaseModel):
+class PrivateBill(_ORMBase):
     """Private member bill"""
     id: Optional[int] = None
     mp_code: Optional[int] = None
@@ -117,10 +119,7 @@ class PrivateBill(BaseModel):
     billName: Optional[str] = None
     debate_date: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-class GovernmentBill(BaseModel):
+class GovernmentBill(_ORMBase):
     """Government bill"""
     id: Optional[int] = None
     srno: Optional[int] = None
@@ -129,14 +128,11 @@ class GovernmentBill(BaseModel):
     bill_title: Optional[str] = None
     debate_date: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # QUESTION MODELS
 # ============================================================
 
-class Question(BaseModel):
+class Question(_ORMBase):
     """Parliamentary question"""
     questionId: Optional[int] = None
     srno: Optional[int] = None
@@ -146,14 +142,11 @@ class Question(BaseModel):
     ministry: Optional[str] = None
     subject: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # DEBATE MODELS
 # ============================================================
 
-class Debate(BaseModel):
+class Debate(_ORMBase):
     """Parliamentary debate"""
     debateId: Optional[int] = None
     srno: Optional[int] = None
@@ -162,14 +155,11 @@ class Debate(BaseModel):
     title: Optional[str] = None
     debateDate: Optional[date] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # SPECIAL MENTION MODELS
 # ============================================================
 
-class SpecialMention(BaseModel):
+class SpecialMention(_ORMBase):
     """Special mention (Zero hour)"""
     id: Optional[int] = None
     srno: Optional[int] = None
@@ -177,14 +167,11 @@ class SpecialMention(BaseModel):
     madeDate: Optional[date] = None
     subject: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # TOUR MODELS
 # ============================================================
 
-class Tour(BaseModel):
+class Tour(_ORMBase):
     """MP tour"""
     id: Optional[int] = None
     srno: Optional[int] = None
@@ -192,14 +179,11 @@ class Tour(BaseModel):
     tour_place: Optional[str] = None
     tour_date: Optional[date] = None
 
-    class Config:
-        from_attributes = True
-
 # ============================================================
 # DETAIL MODELS
 # ============================================================
 
-class PersonalDetails(BaseModel):
+class PersonalDetails(_ORMBase):
     """Personal details"""
     srno: Optional[int] = None
     fatherName: Optional[str] = None
@@ -208,10 +192,7 @@ class PersonalDetails(BaseModel):
     spouseName: Optional[str] = None
     qualification: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-class OtherDetails(BaseModel):
+class OtherDetails(_ORMBase):
     """Other details"""
     srno: Optional[int] = None
     freedomFighter: Optional[str] = None
@@ -219,10 +200,7 @@ class OtherDetails(BaseModel):
     booksPublished: Optional[str] = None
     sportsInterests: Optional[str] = None
 
-    class Config:
-        from_attributes = True
-
-class Dashboard(BaseModel):
+class Dashboard(_ORMBase):
     """Dashboard statistics"""
     srno: Optional[int] = None
     questionsCount: Optional[int] = None
@@ -230,5 +208,19 @@ class Dashboard(BaseModel):
     committeeCount: Optional[int] = None
     debatesCount: Optional[int] = None
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+class MPProfile(_ORMBase):
+    """Personal details, other details and dashboard statistics in one row"""
+    srno: Optional[int] = None
+    fatherName: Optional[str] = None
+    motherName: Optional[str] = None
+    dateBirth: Optional[date] = None
+    spouseName: Optional[str] = None
+    qualification: Optional[str] = None
+    freedomFighter: Optional[str] = None
+    countriesVisited: Optional[str] = None
+    booksPublished: Optional[str] = None
+    sportsInterests: Optional[str] = None
+    questionsCount: Optional[int] = None
+    billsCount: Optional[int] = None
+    committeeCount: Optional[int] = None
+    debatesCount: Optional[int] = None